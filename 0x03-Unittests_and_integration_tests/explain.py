@@ -217,8 +217,9 @@ class TestGithubOrgClient(unittest.TestCase):
         # Create an instance of GithubOrgClient
         client = GithubOrgClient(org_name)
 
-        # Call the org method
-        result = client.org()
+        # Access the memoized org property twice
+        result = client.org
+        client.org
 
         # Assert that get_json was called once with the expected URL
         expected_url = f"https://api.github.com/orgs/{org_name}"
@@ -4,7 +4,7 @@ from client import GithubOrgClient
 import unittest
 from typing import Any, Dict, Tuple, Union
 from parameterized import parameterized, parameterized_class
-from unittest.mock import patch, PropertyMock, Mock
+from unittest.mock import patch, PropertyMock
 from fixtures import TEST_PAYLOAD
 
 from utils import access_nested_map, get_json, memoize
@@ -60,25 +60,22 @@ class TestGetJson(unittest.TestCase):
         ("http://example.com", {"payload": True}),
         ("http://holberton.io", {"payload": False}),
     ])
-    def test_get_json(self, test_url, test_payload):
+    @patch('utils.requests.get')
+    def test_get_json(self, test_url, test_payload, mock_get):
         """
         Test that get_json returns the expected result.
         """
-        with patch('utils.requests.get') as mock_get:
-            # Create a mock response object
-            mock_response = Mock()
-            mock_response.json.return_value = test_payload
-            mock_get.return_value = mock_response
+        # Configure the auto-created response mock directly
+        mock_get.return_value.json.return_value = test_payload
 
-            # Call the function with the test URL
-            result = get_json(test_url)
+        # Call the function with the test URL
+        result = get_json(test_url)
 
-            # Assert that requests.get was called exactly once with the test
-            # URL
-            mock_get.assert_called_once_with(test_url)
+        # Assert that requests.get was called exactly once with the test URL
+        mock_get.assert_called_once_with(test_url)
 
-            # Assert that the output of get_json is equal to the test_payload
-            self.assertEqual(result, test_payload)
+        # Assert that the output of get_json is equal to the test_payload
+        self.assertEqual(result, test_payload)
 
 # task 4
 
@@ -164,10 +161,13 @@ class TestGithubOrgClient(unittest.TestCase):
     @patch('client.get_json')
     def test_org(self, org_name, mock):
         """Test TestGithubOrgClient.org return the correct value
+        and only hits get_json once across repeated accesses
         """
+        mock.return_value = {"login": org_name}
         test_class = GithubOrgClient(org_name)
-        test_class.org()
-        mock.called_with_once(test_class.ORG_URL.format(org=org_name))
+        self.assertEqual(test_class.org, {"login": org_name})
+        self.assertEqual(test_class.org, {"login": org_name})
+        mock.assert_called_once_with(test_class.ORG_URL.format(org=org_name))
 
     def test_public_repos_url(self):
         """Test TestGithubOrgClient.public_repos_url
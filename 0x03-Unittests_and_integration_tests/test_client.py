@@ -26,6 +26,7 @@ class TestGithubOrgClient(unittest.TestCase):
         get_patch.return_value = expected
         x = GithubOrgClient(org)
         self.assertEqual(x.org, expected)
+        self.assertEqual(x.org, expected)
         get_patch.assert_called_once_with("https://api.github.com/orgs/"+org)
 
     def test_public_repos_url(self):
@@ -4,7 +4,7 @@ from utils import access_nested_map, get_json, memoize
 from typing import Mapping, Sequence, Any, ClassVar
 from unittest import main, TestCase
 from parameterized import parameterized
-from unittest.mock import patch, Mock
+from unittest.mock import patch
 
 
 class TestAccessNestedMap(TestCase):
@@ -69,11 +69,10 @@ class TestGetJson(TestCase):
             test_url (_type_): _description_
             test_payload (_type_): _description_
         """
-        response = Mock()
-        response.json.return_value = test_payload
-        url_get.return_value = response
+        url_get.return_value.json.return_value = test_payload
 
         result = get_json(test_url)
+        url_get.assert_called_once_with(test_url)
         self.assertEqual(result, test_payload)
 
 
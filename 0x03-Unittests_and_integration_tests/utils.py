@@ -2,7 +2,7 @@
 """Generic utilities for github org client.
 """
 import requests
-from functools import wraps
+from functools import update_wrapper
 from typing import (
     Mapping,
     Sequence,
@@ -47,8 +47,12 @@ def get_json(url: str) -> Dict:
     return response.json()
 
 
-def memoize(fn: Callable) -> Callable:
+class memoize:
     """Decorator to memoize a method.
+    The first access computes the value and stores it in the instance
+    ``__dict__`` under the method's name. As a non-data descriptor, memoize
+    is then shadowed by that entry, so later accesses are plain attribute
+    lookups (the same trick as ``functools.cached_property``).
     Example
     -------
     class MyClass:
@@ -63,13 +67,17 @@ def memoize(fn: Callable) -> Callable:
     >>> my_object.a_method
     42
     """
-    attr_name = "_{}".format(fn.__name__)
 
-    @wraps(fn)
-    def memoized(self):
-        """"memoized wraps"""
-        if not hasattr(self, attr_name):
-            setattr(self, attr_name, fn(self))
-        return getattr(self, attr_name)
+    def __init__(self, fn: Callable) -> None:
+        """Wrap fn, keeping its name and docstring"""
+        self.fn = fn
+        self.attr_name = fn.__name__
+        update_wrapper(self, fn)
 
-    return property(memoized)
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        """Compute once, then cache the value on the instance"""
+        if instance is None:
+            return self
+        value = self.fn(instance)
+        instance.__dict__[self.attr_name] = value
+        return value
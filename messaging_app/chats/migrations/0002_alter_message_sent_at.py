@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chats', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='message',
+            name='sent_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
@@ -0,0 +1,6 @@
+from rest_framework.pagination import CursorPagination
+
+class MessageCursorPagination(CursorPagination):
+    # Keyset pagination on the send time: each page is an index seek
+    # instead of an OFFSET scan over the messages table.
+    ordering = '-sent_at'
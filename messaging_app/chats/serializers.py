@@ -1,17 +1,70 @@
+import uuid
+
 from rest_framework import serializers
 from .models import User, Message, Conversation
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = '__all__'
+        fields = (
+            'user_id', 'first_name', 'last_name', 'email', 'password_hash',
+            'phone_number', 'role', 'created_at',
+        )
+        # Accepted on create but never echoed back in responses
+        extra_kwargs = {'password_hash': {'write_only': True}}
+
+class UserListSerializer(serializers.Serializer):
+    # Read-only shape for user listings, fed from values() dicts
+    user_id = serializers.UUIDField(read_only=True)
+    first_name = serializers.CharField(read_only=True)
+    last_name = serializers.CharField(read_only=True)
+    email = serializers.EmailField(read_only=True)
+    phone_number = serializers.CharField(read_only=True, allow_null=True)
+    role = serializers.CharField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+class SenderField(serializers.PrimaryKeyRelatedField):
+    def to_internal_value(self, data):
+        # Inside a bulk POST, resolve from the senders the list serializer
+        # loaded up front instead of running a get() per message
+        senders = getattr(self.root, 'prefetched_senders', None)
+        if senders is None:
+            return super().to_internal_value(data)
+        try:
+            return senders[uuid.UUID(str(data))]
+        except ValueError:
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        except KeyError:
+            self.fail('does_not_exist', pk_value=data)
+
+class MessageListSerializer(serializers.ListSerializer):
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            sender_ids = set()
+            for item in data:
+                try:
+                    sender_ids.add(uuid.UUID(str(item.get('sender'))))
+                except (AttributeError, ValueError):
+                    pass  # Reported per item by SenderField / the child
+            # One query for every sender in the batch
+            self.prefetched_senders = User.objects.in_bulk(sender_ids)
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        # One multi-row INSERT instead of a save() per message
+        return Message.objects.bulk_create(
+            [Message(**item) for item in validated_data]
+        )
 
 class MessageSerializer(serializers.ModelSerializer):
+    sender = SenderField(queryset=User.objects.all())
+
     class Meta:
         model = Message
-        fields = '__all__'
+        fields = ('message_id', 'sender', 'message_body', 'sent_at')
+        list_serializer_class = MessageListSerializer
 
 class ConversationSerializer(serializers.ModelSerializer):
     class Meta:
         model = Conversation
-        fields = '__all__'
+        fields = ('conversation_id', 'participants', 'created_at')
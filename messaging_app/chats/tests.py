@@ -1,3 +1,90 @@
-from django.test import TestCase
+import json
+import uuid
+from operator import itemgetter
 
-# Create your tests here.
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .models import User, Message
+
+
+@override_settings(ROOT_URLCONF='chats.urls')
+class MessageCreateAPITestCase(APITestCase):
+    """Tests for POST /messages/ with single and bulk payloads."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.sender = User.objects.create(
+            first_name='Ada', last_name='Lovelace', email='ada@example.com',
+            password_hash='x', role='guest',
+        )
+        cls.url = reverse('message_list_create')
+
+    def test_list_post_bulk_creates_in_two_queries(self):
+        payload = [
+            {'sender': str(self.sender.pk), 'message_body': f'hello {i}'}
+            for i in range(5)
+        ]
+        # One SELECT for all senders plus one multi-row INSERT
+        with self.assertNumQueries(2):
+            response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(
+            [item['message_body'] for item in response.data],
+            [f'hello {i}' for i in range(5)],
+        )
+        self.assertEqual(Message.objects.count(), 5)
+
+    def test_single_post_still_creates_one_message(self):
+        payload = {'sender': str(self.sender.pk), 'message_body': 'hi'}
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIsInstance(response.data, dict)
+        self.assertEqual(response.data['message_body'], 'hi')
+        self.assertEqual(Message.objects.get().message_body, 'hi')
+
+    def test_list_post_rejects_unknown_sender(self):
+        payload = [
+            {'sender': str(self.sender.pk), 'message_body': 'ok'},
+            {'sender': str(uuid.uuid4()), 'message_body': 'lost'},
+        ]
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('sender', response.data[1])
+        self.assertFalse(Message.objects.exists())
+
+
+@override_settings(ROOT_URLCONF='chats.urls')
+class MessageStreamAPITestCase(APITestCase):
+    """Tests for GET /messages/stream/."""
+
+    @classmethod
+    def setUpTestData(cls):
+        sender = User.objects.create(
+            first_name='Ada', last_name='Lovelace', email='ada@example.com',
+            password_hash='x', role='guest',
+        )
+        for i in range(3):
+            Message.objects.create(sender=sender, message_body=f'hello {i}')
+
+    def test_stream_matches_paginated_list(self):
+        response = self.client.get(reverse('message_stream'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        streamed = json.loads(
+            b''.join(response.streaming_content).decode()
+        )
+
+        listed = json.loads(
+            self.client.get(reverse('message_list_create')).content
+        )['results']
+
+        by_id = itemgetter('message_id')
+        self.assertEqual(len(streamed), 3)
+        # Same keys and values, sent_at included at full precision
+        self.assertEqual(sorted(streamed, key=by_id), sorted(listed, key=by_id))
@@ -1,8 +1,9 @@
 from django.urls import path
-from .views import UserListCreateAPIView, MessageListCreateAPIView, ConversationListCreateAPIView
+from .views import UserListCreateAPIView, MessageListCreateAPIView, MessageStreamAPIView, ConversationListCreateAPIView
 
 urlpatterns = [
     path('users/', UserListCreateAPIView.as_view(), name='user_list_create'),
     path('messages/', MessageListCreateAPIView.as_view(), name='message_list_create'),
+    path('messages/stream/', MessageStreamAPIView.as_view(), name='message_stream'),
     path('conversations/', ConversationListCreateAPIView.as_view(), name='conversation_list_create'),
 ]
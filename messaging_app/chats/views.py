@@ -1,15 +1,65 @@
+import json
+
+from django.http import StreamingHttpResponse
 from rest_framework import generics
+from rest_framework.utils.encoders import JSONEncoder
 from .models import User, Message, Conversation
-from .serializers import UserSerializer, MessageSerializer, ConversationSerializer
+from .pagination import MessageCursorPagination
+from .serializers import (
+    UserSerializer, UserListSerializer, MessageSerializer, ConversationSerializer,
+)
 
 class UserListCreateAPIView(generics.ListCreateAPIView):
-    queryset = User.objects.all()
     serializer_class = UserSerializer
 
+    def get_queryset(self):
+        # Narrow SELECT straight into dicts; password_hash is never listed
+        return User.objects.values(
+            'user_id', 'first_name', 'last_name', 'email',
+            'phone_number', 'role', 'created_at',
+        ).order_by('pk')
+
+    def get_serializer_class(self):
+        # Creation still goes through the full ModelSerializer validation
+        if self.request.method == 'GET':
+            return UserListSerializer
+        return UserSerializer
+
 class MessageListCreateAPIView(generics.ListCreateAPIView):
     queryset = Message.objects.all()
     serializer_class = MessageSerializer
+    pagination_class = MessageCursorPagination
+
+    def get_serializer(self, *args, **kwargs):
+        # Accept a JSON array of messages and create them in bulk
+        if isinstance(kwargs.get('data'), list):
+            kwargs['many'] = True
+        return super().get_serializer(*args, **kwargs)
+
+class MessageStreamAPIView(generics.GenericAPIView):
+    def get_queryset(self):
+        # Plain dicts with the MessageSerializer keys, no model instances
+        return Message.objects.order_by('-sent_at').values(
+            *MessageSerializer.Meta.fields
+        )
+
+    def get(self, request, *args, **kwargs):
+        # Write the JSON array row by row so memory stays bounded by one
+        # iterator chunk and the first bytes go out immediately
+        def stream():
+            yield '['
+            for i, row in enumerate(self.get_queryset().iterator(chunk_size=2000)):
+                yield (',' if i else '') + json.dumps(row, cls=JSONEncoder)
+            yield ']'
+
+        return StreamingHttpResponse(stream(), content_type='application/json')
 
 class ConversationListCreateAPIView(generics.ListCreateAPIView):
-    queryset = Conversation.objects.all()
     serializer_class = ConversationSerializer
+
+    def get_queryset(self):
+        # Fetch all participants in one extra query rather than per conversation
+        return (
+            Conversation.objects.prefetch_related('participants')
+            .order_by('pk')
+        )
@@ -3,51 +3,41 @@
 1-batch_processing.py - Batch processing large data with Python generators.
 """
 
-import mysql.connector
+from contextlib import closing
 from mysql.connector import Error
+from db import get_connection, UserRow
 
 
-def stream_users_in_batches(batch_size):
+def stream_users_in_batches(batch_size, min_age=None):
     """
     Generator that streams rows from the user_data table in batches.
     Args:
         batch_size (int): Number of rows per batch.
+        min_age (int, optional): Only stream users strictly older than this.
     Yields:
-        list[dict]: A batch of rows as dictionaries.
+        list[UserRow]: A batch of rows as named tuples.
     """
-    connection = None
-    cursor = None
-    try:
-        # Connect to the ALX_prodev database
-        connection = mysql.connector.connect(
-            host="localhost",
-            user="root",  # Replace with your MySQL username
-            password="password",  # Replace with your MySQL password
-            database="ALX_prodev"
-        )
-        cursor = connection.cursor(dictionary=True)
-        cursor.execute("SELECT * FROM user_data;")
+    query = "SELECT user_id, name, email, age FROM user_data"
+    params = ()
+    if min_age is not None:
+        # Let the server filter so non-matching rows never cross the wire
+        query += " WHERE age > %s"
+        params = (min_age,)
 
-        # Fetch rows in batches
-        while True:
-            batch = cursor.fetchmany(batch_size)
-            if not batch:
-                break
-            yield batch
+    try:
+        # Unbuffered: fetchmany() only pulls batch_size rows at a time
+        with closing(get_connection()) as connection, \
+                closing(connection.cursor(buffered=False)) as cursor:
+            cursor.execute(query, params)
+
+            # Fetch rows in batches
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                yield [UserRow._make(row) for row in batch]
     except Error as e:
         print(f"Database error: {e}")
-    finally:
-        # Ensure proper cleanup
-        if cursor:
-            try:
-                cursor.close()
-            except Error as e:
-                print(f"Error closing cursor: {e}")
-        if connection and connection.is_connected():
-            try:
-                connection.close()
-            except Error as e:
-                print(f"Error closing connection: {e}")
 
 
 def batch_processing(batch_size):
@@ -56,10 +46,8 @@ def batch_processing(batch_size):
     Args:
         batch_size (int): Number of rows per batch.
     """
-    for batch in stream_users_in_batches(batch_size):
-        # Filter users with age > 25
-        filtered_users = (user for user in batch if user["age"] > 25)
-        for user in filtered_users:
+    for batch in stream_users_in_batches(batch_size, min_age=25):
+        for user in batch:
             print(user)
 
 
@@ -3,28 +3,28 @@
 2-lazy_paginate.py - Lazy loading paginated data with Python generators.
 """
 
-import mysql.connector
+from db import UserRow
 from seed import connect_to_prodev  # Import connect_to_prodev from seed.py
 
 
-def paginate_users(page_size, offset):
+def paginate_users(cursor, page_size, last_id=''):
     """
     Fetch a single page of user data from the user_data table.
     Args:
+        cursor: An open cursor on the ALX_prodev database.
         page_size (int): Number of rows per page.
-        offset (int): Offset for the SQL query.
+        last_id (str): user_id of the last row of the previous page.
     Returns:
-        list[dict]: A list of rows as dictionaries.
+        list[UserRow]: A list of rows as named tuples.
     """
-    connection = connect_to_prodev()
-    cursor = connection.cursor(dictionary=True)
-    try:
-        cursor.execute(f"SELECT * FROM user_data LIMIT {page_size} OFFSET {offset}")
-        rows = cursor.fetchall()
-        return rows
-    finally:
-        cursor.close()
-        connection.close()
+    # Keyset pagination: seek past the last seen primary key instead of
+    # scanning and discarding OFFSET rows.
+    cursor.execute(
+        "SELECT user_id, name, email, age FROM user_data "
+        "WHERE user_id > %s ORDER BY user_id LIMIT %s",
+        (last_id, page_size)
+    )
+    return [UserRow._make(row) for row in cursor.fetchall()]
 
 
 def lazy_paginate(page_size):
@@ -33,12 +33,19 @@ def lazy_paginate(page_size):
     Args:
         page_size (int): Number of rows per page.
     Yields:
-        list[dict]: A page of rows as dictionaries.
+        list[UserRow]: A page of rows as named tuples.
     """
-    offset = 0
-    while True:
-        page = paginate_users(page_size, offset)
-        if not page:  # Stop if the page is empty
-            break
-        yield page
-        offset += page_size  # Move to the next page
+    connection = connect_to_prodev()
+    # Prepared cursor: the query is parsed once and re-executed per page
+    cursor = connection.cursor(prepared=True)
+    try:
+        last_id = ''
+        while True:
+            page = paginate_users(cursor, page_size, last_id)
+            if not page:  # Stop if the page is empty
+                break
+            yield page
+            last_id = page[-1].user_id  # Resume after the last row
+    finally:
+        cursor.close()
+        connection.close()
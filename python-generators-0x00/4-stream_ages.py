@@ -3,7 +3,6 @@
 4-stream_ages.py - Memory-efficient aggregation with Python generators.
 """
 
-import mysql.connector
 from seed import connect_to_prodev  # Import connect_to_prodev from seed.py
 
 
@@ -16,9 +15,27 @@ def stream_user_ages():
     connection = connect_to_prodev()
     cursor = connection.cursor()
     try:
-        cursor.execute("SELECT age FROM user_data;")
+        # Cast server-side so the driver returns ints, not Decimals
+        cursor.execute("SELECT CAST(age AS UNSIGNED) FROM user_data;")
         for row in cursor:
-            yield int(row[0])  # Extract age as an integer
+            yield row[0]
+    finally:
+        cursor.close()
+        connection.close()
+
+
+def average_age_sql():
+    """
+    Computes the average user age in a single aggregate query.
+    Returns:
+        float | None: The average age, or None if the table is empty.
+    """
+    connection = connect_to_prodev()
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT AVG(age) FROM user_data;")
+        row = cursor.fetchone()
+        return float(row[0]) if row[0] is not None else None
     finally:
         cursor.close()
         connection.close()
@@ -26,17 +43,15 @@ def stream_user_ages():
 
 def calculate_average_age():
     """
-    Calculates the average age of users using the stream_user_ages generator.
+    Calculates the average age of users.
+    The aggregation runs in the database so only one row crosses the wire;
+    stream_user_ages remains available for row-by-row processing.
     Prints:
         str: Average age of users.
     """
-    total_age = 0
-    count = 0
-    for age in stream_user_ages():
-        total_age += age
-        count += 1
-    if count > 0:
-        print(f"Average age of users: {total_age / count}")
+    average_age = average_age_sql()
+    if average_age is not None:
+        print(f"Average age of users: {average_age}")
     else:
         print("No users found to calculate average age.")
 
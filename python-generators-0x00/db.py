@@ -0,0 +1,42 @@
+#!/usr/bin/python3
+"""
+db.py - Shared MySQL connection pool for the ALX_prodev database.
+"""
+
+from collections import namedtuple
+from mysql.connector import pooling
+
+# Lightweight row type for user_data; cheaper than a dict per row
+UserRow = namedtuple("UserRow", "user_id name email age")
+
+POOL_NAME = "prodev"
+POOL_SIZE = 8
+
+_pool = None
+
+
+def get_connection():
+    """
+    Borrow a connection to ALX_prodev from the shared pool.
+    The pool is created on first use, so importing this module does not
+    require the database to exist yet. Calling close() on the returned
+    connection hands it back to the pool instead of disconnecting.
+    Returns:
+        PooledMySQLConnection: A connection to the ALX_prodev database.
+    """
+    global _pool
+    if _pool is None:
+        _pool = pooling.MySQLConnectionPool(
+            pool_name=POOL_NAME,
+            pool_size=POOL_SIZE,
+            host="localhost",
+            user="root",  # Replace with your MySQL username
+            password="",  # Replace with your MySQL password
+            database="ALX_prodev",
+            autocommit=True,  # Streaming reads need no BEGIN/COMMIT
+            # Discard unread rows when a generator is abandoned early, so
+            # closing its unbuffered cursor doesn't raise and the connection
+            # goes back to the pool clean
+            consume_results=True
+        )
+    return _pool.get_connection()
@@ -4,9 +4,20 @@ seed.py - Setup MySQL database and seed it with data from user_data.csv
 """
 import uuid 
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, errorcode
 import csv
 import os
+from contextlib import closing
+from db import get_connection
+
+BATCH_SIZE = 1000  # Rows sent per executemany() call when seeding
+
+# Error codes meaning LOAD DATA LOCAL INFILE is disabled on either side
+LOCAL_INFILE_DISABLED = {
+    errorcode.ER_NOT_ALLOWED_COMMAND,
+    errorcode.ER_CLIENT_LOCAL_FILES_DISABLED,
+    errorcode.CR_LOAD_DATA_LOCAL_INFILE_REJECTED,
+}
 
 
 def connect_db():
@@ -38,18 +49,29 @@ def create_database(connection):
 def connect_to_prodev():
     """Connect to the ALX_prodev database."""
     try:
-        connection = mysql.connector.connect(
-            host="localhost",
-            user="root",  # Replace with your MySQL username
-            password="",  # Replace with your MySQL password
-            database="ALX_prodev"
-        )
-        return connection
+        return get_connection()
     except Error as e:
         print(f"Error connecting to ALX_prodev database: {e}")
         return None
 
 
+def connect_for_load(csv_file):
+    """Open a dedicated ALX_prodev connection for LOAD DATA LOCAL INFILE.
+
+    Local infile is only allowed for files in the CSV's own directory, so
+    the server cannot request any other file from the client. The shared
+    pool used by the generators keeps local infile disabled.
+    """
+    return mysql.connector.connect(
+        host="localhost",
+        user="root",  # Replace with your MySQL username
+        password="",  # Replace with your MySQL password
+        database="ALX_prodev",
+        allow_local_infile=False,  # The in_path limit only applies when False
+        allow_local_infile_in_path=os.path.dirname(os.path.abspath(csv_file))
+    )
+
+
 def create_table(connection):
     """Create the user_data table if it does not exist."""
     try:
@@ -62,6 +84,13 @@ def create_table(connection):
                 age DECIMAL(3,0) NOT NULL
             );
         """)
+        # Added separately so tables created before the index existed get
+        # it too; the age filters in the generators rely on it
+        try:
+            cursor.execute("CREATE INDEX idx_user_age ON user_data (age);")
+        except Error as e:
+            if e.errno != errorcode.ER_DUP_KEYNAME:
+                raise
         print("Table user_data created successfully.")
     except Error as e:
         print(f"Error creating table: {e}")
@@ -69,37 +98,109 @@ def create_table(connection):
         cursor.close()
 
 
+def load_data_infile(csv_file):
+    """Bulk load a CSV file into the user_data table with LOAD DATA.
+
+    The server reads the file straight into the table and generates each
+    user_id with UUID(), so no rows are built in Python. The load runs on
+    its own connection from connect_for_load().
+    """
+    with open(csv_file, mode="r", newline="") as file:
+        header = next(csv.reader(file), None)
+    if not header or sorted(header) != ['age', 'email', 'name']:
+        raise ValueError("LOAD DATA needs exactly the columns: name, email, age")
+
+    # Match the file's line endings so CRLF files don't leave '\r' in age
+    with open(csv_file, mode="rb") as file:
+        first_line = file.readline()
+    line_end = '\\r\\n' if first_line.endswith(b'\r\n') else '\\n'
+
+    with closing(connect_for_load(csv_file)) as connection, \
+            closing(connection.cursor()) as cursor:
+        cursor.execute(f"""
+            LOAD DATA LOCAL INFILE %s INTO TABLE user_data
+            FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"'
+            LINES TERMINATED BY '{line_end}'
+            IGNORE 1 LINES
+            ({", ".join(header)})
+            SET user_id = UUID();
+        """, (os.path.abspath(csv_file),))
+        connection.commit()
+
+
 def insert_data(connection, csv_file):
-    """Insert data into the user_data table from a CSV file."""
+    """Insert data into the user_data table from a CSV file.
+
+    Uses LOAD DATA LOCAL INFILE and falls back to batched INSERTs when
+    local infile is disabled by the client or the server, or when the CSV
+    has columns other than name, email and age.
+    """
     if not os.path.exists(csv_file):
         print(f"File {csv_file} not found.")
         return
 
     try:
-        cursor = connection.cursor()
-        with open(csv_file, mode="r") as file:
-            csv_reader = csv.DictReader(file)
-
-            # Check if headers are present
-            if not csv_reader.fieldnames or {'name', 'email', 'age'} - set(csv_reader.fieldnames):
-                print(f"CSV file headers must include: name, email, age")
-                return
-
+        load_data_infile(csv_file)
+        print("Data inserted successfully.")
+        return
+    except ValueError:
+        pass  # Extra or missing columns: the batched loader handles them
+    except Error as e:
+        if e.errno not in LOCAL_INFILE_DISABLED:
+            print(f"Error loading data from CSV: {e}")
+            return
+    insert_data_batched(connection, csv_file)
+
+
+def insert_data_batched(connection, csv_file, chunk_size=BATCH_SIZE):
+    """Insert data into the user_data table from a CSV file.
+
+    Rows are sent with executemany() in chunks of chunk_size inside a single
+    transaction, so the load costs one round-trip per chunk instead of one
+    per row.
+    """
+    query = """
+        INSERT INTO user_data (user_id, name, email, age)
+        VALUES (%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+        name=VALUES(name), email=VALUES(email), age=VALUES(age)
+    """
+    with closing(connection.cursor()) as cursor, \
+            open(csv_file, mode="r") as file:
+        csv_reader = csv.DictReader(file)
+
+        # Check if headers are present
+        if not csv_reader.fieldnames or {'name', 'email', 'age'} - set(csv_reader.fieldnames):
+            print(f"CSV file headers must include: name, email, age")
+            return
+
+        try:
+            # Explicit transaction: the pooled connection runs in autocommit
+            connection.start_transaction()
+            # Skip per-row constraint checks for the duration of the bulk load
+            cursor.execute("SET unique_checks=0;")
+            cursor.execute("SET foreign_key_checks=0;")
+
+            chunk = []
             for row in csv_reader:
                 user_id = str(uuid.uuid4())  # Generate a unique user_id
-                cursor.execute("""
-                    INSERT INTO user_data (user_id, name, email, age)
-                    VALUES (%s, %s, %s, %s)
-                    ON DUPLICATE KEY UPDATE 
-                    name=VALUES(name), email=VALUES(email), age=VALUES(age);
-                """, (user_id, row["name"], row["email"], row["age"]))
+                chunk.append((user_id, row["name"], row["email"], row["age"]))
+                if len(chunk) >= chunk_size:
+                    cursor.executemany(query, chunk)
+                    chunk.clear()
+            if chunk:
+                cursor.executemany(query, chunk)
+
             connection.commit()
             print("Data inserted successfully.")
-    except Error as e:
-        print(f"Error reading or inserting data from CSV: {e}")
-    finally:
-        cursor.close()
-
+        except Error as e:
+            connection.rollback()
+            print(f"Error reading or inserting data from CSV: {e}")
+        finally:
+            # Re-enable the checks after commit or rollback alike; the caller
+            # keeps using this connection
+            cursor.execute("SET unique_checks=1;")
+            cursor.execute("SET foreign_key_checks=1;")
 
 
 if __name__ == "__main__":